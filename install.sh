@@ -38,7 +38,8 @@ info "uv version: $(uv --version)"
 
 # Install kd using uv tool
 info "Installing kd..."
-uv tool install --force git+https://github.com/bestend/kidsnote.git
+# The fast extra adds uvloop (skipped on Windows)
+uv tool install --force "kd[fast] @ git+https://github.com/bestend/kidsnote.git"
 
 # Install Playwright browser
 info "Installing Chromium browser for login..."
@@ -0,0 +1,6 @@
+"""백그라운드 업데이트 확인 (python -m kd._update_check)"""
+
+from kd.cli import check_remote
+
+if __name__ == "__main__":
+    check_remote()
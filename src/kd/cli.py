@@ -1,28 +1,39 @@
-import json
 import asyncio
+import functools
+import os
 import re
 import platform
 import subprocess
 import sys
-from dataclasses import dataclass, field
+from dataclasses import dataclass, field, replace
+from http.cookies import Morsel
 from datetime import datetime
 from pathlib import Path
 from typing import Annotated, Any
-from urllib.parse import urlparse, parse_qs
+from urllib.parse import urlsplit
 
 import aiohttp
-import aiofiles
+import orjson
 import typer
 from loguru import logger
-from playwright.async_api import async_playwright, Request
-from tqdm.asyncio import tqdm
+from playwright.async_api import async_playwright, Request, Route
+from tqdm import tqdm
 
 from kd import __version__
 
 app = typer.Typer(help="키즈노트 앨범 미디어 다운로더")
 
 
+_ISO_DATE_RE = re.compile(r"\d{4}-\d{2}-\d{2}")
+_CHILD_ALBUM_RE = re.compile(
+    r"https?://www\.kidsnote\.com/api/v1_3/children/(\d+)/albums/"
+)
+_CENTER_RE = re.compile(r"[?&]center=(\d+)")
+_CLS_RE = re.compile(r"[?&]cls=(\d+)")
+
+ALBUM_ROUTE_PATTERN = "**/api/v1_3/children/*/albums/**"
 KIDSNOTE_LOGIN_URL = "https://www.kidsnote.com/login"
+KIDSNOTE_CHILD_API = "https://www.kidsnote.com/api/v1_3/children/{child_id}/"
 KIDSNOTE_ALBUM_API = "https://www.kidsnote.com/api/v1_3/children/{child_id}/albums/"
 GITHUB_REPO = "bestend/kidsnote"
 GITHUB_API_RELEASES = f"https://api.github.com/repos/{GITHUB_REPO}/releases/latest"
@@ -32,6 +43,8 @@ CONFIG_DIR = Path.home() / ".config" / "kidsnote"
 CONFIG_FILE = CONFIG_DIR / "config.json"
 SESSION_FILE = CONFIG_DIR / "session.json"
 UPDATE_CHECK_FILE = CONFIG_DIR / "update_check.json"
+# 로그인 브라우저 프로필 (쿠키와 캐시를 다음 로그인에서 다시 씀)
+BROWSER_PROFILE_DIR = CONFIG_DIR / "browser_profile"
 
 # 로그 파일도 설정 폴더에 저장
 CONFIG_DIR.mkdir(parents=True, exist_ok=True)
@@ -49,60 +62,150 @@ def parse_version(version: str) -> tuple[int, ...]:
     return tuple(parts)
 
 
+def _atomic_write_bytes(path: Path, data: bytes) -> None:
+    """임시 파일에 쓴 뒤 교체해서, 쓰다가 중단돼도 기존 파일이 깨지지 않게 합니다."""
+    tmp = path.with_name(path.name + ".tmp")
+    try:
+        with open(tmp, "wb") as f:
+            f.write(data)
+        os.replace(tmp, path)
+    except BaseException:
+        tmp.unlink(missing_ok=True)
+        raise
+
+
 CACHE_TTL_24_HOURS = 86400
+# 업데이트 확인이 실패해도 이 간격 안에는 다시 시도하지 않습니다.
+UPDATE_RETRY_SECONDS = 3600
 
+# 응답 본문을 읽는 단위 (청크마다 생기는 await 비용을 줄이도록 크게)
+READ_CHUNK_SIZE = 256 * 1024
+# writev 한 번에 넘기는 최대 버퍼 수 (IOV_MAX보다 충분히 작게)
+MAX_WRITE_BUFFERS = 64
 
-def check_for_updates() -> tuple[bool, str | None]:
+
+def _load_update_cache() -> dict:
+    try:
+        cache = orjson.loads(UPDATE_CHECK_FILE.read_bytes())
+    except (orjson.JSONDecodeError, OSError):
+        return {}
+    return cache if isinstance(cache, dict) else {}
+
+
+def _update_result(latest_version: str | None) -> tuple[bool, str | None]:
+    if latest_version and parse_version(latest_version) > parse_version(__version__):
+        return (True, latest_version)
+    return (False, None)
+
+
+def check_cached() -> tuple[bool, str | None] | None:
+    """캐시 파일만 보고 업데이트 여부를 반환합니다. 캐시가 없거나 오래되면 None."""
+    cache = _load_update_cache()
+    try:
+        last_check = datetime.fromisoformat(cache.get("last_check", ""))
+    except (TypeError, ValueError):
+        return None
+    if (datetime.now() - last_check).total_seconds() >= CACHE_TTL_24_HOURS:
+        return None
+    return _update_result(cache.get("latest_version"))
+
+
+def check_remote() -> tuple[bool, str | None]:
+    """GitHub에서 최신 버전을 확인하고 캐시 파일을 갱신합니다."""
     import urllib.request
     import urllib.error
 
-    now = datetime.now()
+    cache = _load_update_cache()
+    headers = {
+        "Accept": "application/vnd.github.v3+json",
+        "User-Agent": "kd-updater",
+    }
+    # 이전 응답의 ETag를 보내면 바뀐 게 없을 때 GitHub가 본문 없이 304를 줍니다.
+    etag = cache.get("etag")
+    if etag and cache.get("latest_version"):
+        headers["If-None-Match"] = etag
 
-    if UPDATE_CHECK_FILE.exists():
+    try:
+        req = urllib.request.Request(GITHUB_API_RELEASES, headers=headers)
         try:
-            cache = json.loads(UPDATE_CHECK_FILE.read_text())
-            last_check = datetime.fromisoformat(cache.get("last_check", ""))
-            if (now - last_check).total_seconds() < CACHE_TTL_24_HOURS:
-                cached_latest = cache.get("latest_version")
-                if cached_latest:
-                    has_update = parse_version(cached_latest) > parse_version(
-                        __version__
-                    )
-                    return (has_update, cached_latest) if has_update else (False, None)
-                return (False, None)
-        except (json.JSONDecodeError, ValueError, KeyError):
-            pass
+            with urllib.request.urlopen(req, timeout=5) as resp:
+                data = orjson.loads(resp.read())
+                latest_version = data.get("tag_name", "").lstrip("v")
+                etag = resp.headers.get("ETag")
+        except urllib.error.HTTPError as e:
+            if e.code != 304:
+                raise
+            latest_version = cache["latest_version"]
 
-    try:
-        req = urllib.request.Request(
-            GITHUB_API_RELEASES,
-            headers={
-                "Accept": "application/vnd.github.v3+json",
-                "User-Agent": "kd-updater",
-            },
-        )
-        with urllib.request.urlopen(req, timeout=5) as resp:
-            data = json.loads(resp.read().decode())
-            latest_version = data.get("tag_name", "").lstrip("v")
-
-            if latest_version:
-                cache = {
-                    "last_check": now.isoformat(),
-                    "latest_version": latest_version,
-                }
-                UPDATE_CHECK_FILE.write_text(json.dumps(cache, indent=2))
-
-                if parse_version(latest_version) > parse_version(__version__):
-                    return (True, latest_version)
-    except (urllib.error.URLError, json.JSONDecodeError, TimeoutError, OSError):
+        if latest_version:
+            cache = {
+                "last_check": datetime.now().isoformat(),
+                "latest_version": latest_version,
+            }
+            if etag:
+                cache["etag"] = etag
+            _atomic_write_bytes(
+                UPDATE_CHECK_FILE, orjson.dumps(cache, option=orjson.OPT_INDENT_2)
+            )
+            return _update_result(latest_version)
+    except (urllib.error.URLError, orjson.JSONDecodeError, TimeoutError, OSError):
         pass
 
     return (False, None)
 
 
+def check_for_updates() -> tuple[bool, str | None]:
+    cached = check_cached()
+    return cached if cached is not None else check_remote()
+
+
+def _claim_update_attempt() -> bool:
+    """최근에 확인을 시도하지 않았으면 시도 시각을 기록하고 True를 반환합니다.
+
+    오프라인이거나 GitHub가 요청을 막을 때 명령마다 확인 프로세스를 띄우지 않도록,
+    프로세스를 띄우기 전에 시도 시각부터 남깁니다.
+    """
+    cache = _load_update_cache()
+    now = datetime.now()
+    try:
+        last_attempt = datetime.fromisoformat(cache.get("last_attempt", ""))
+    except (TypeError, ValueError):
+        pass
+    else:
+        if (now - last_attempt).total_seconds() < UPDATE_RETRY_SECONDS:
+            return False
+
+    cache["last_attempt"] = now.isoformat()
+    try:
+        _atomic_write_bytes(
+            UPDATE_CHECK_FILE, orjson.dumps(cache, option=orjson.OPT_INDENT_2)
+        )
+    except OSError:
+        # 기록할 수 없으면 확인 결과도 저장할 수 없으므로 띄우지 않습니다.
+        return False
+    return True
+
+
+def _spawn_update_check() -> None:
+    """네트워크 확인은 별도 프로세스로 돌려 명령 실행을 막지 않습니다."""
+    subprocess.Popen(
+        [sys.executable, "-m", "kd._update_check"],
+        stdin=subprocess.DEVNULL,
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.DEVNULL,
+        start_new_session=True,
+    )
+
+
 def show_update_notice():
     try:
-        has_update, latest_version = check_for_updates()
+        cached = check_cached()
+        if cached is None:
+            # 결과는 캐시에 저장되어 다음 실행에서 알려 줍니다.
+            if _claim_update_attempt():
+                _spawn_update_check()
+            return
+        has_update, latest_version = cached
         if has_update and latest_version:
             typer.echo()
             typer.secho(
@@ -119,6 +222,19 @@ def show_update_notice():
         pass
 
 
+def run_async(coro):
+    """코루틴을 실행합니다. uvloop이 설치되어 있으면 uvloop 이벤트 루프를 씁니다."""
+    try:
+        import uvloop
+    except ImportError:
+        loop_factory = None
+    else:
+        loop_factory = uvloop.new_event_loop
+
+    with asyncio.Runner(loop_factory=loop_factory) as runner:
+        return runner.run(coro)
+
+
 def get_default_download_dir() -> str:
     """OS별 기본 다운로드 경로를 반환합니다."""
     system = platform.system()
@@ -130,7 +246,7 @@ def get_default_download_dir() -> str:
         return str(Path.home() / "Pictures" / "kidsnote")
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class ChildConfig:
     child_id: int
     center: int
@@ -272,57 +388,158 @@ class AppConfig:
         if not CONFIG_FILE.exists():
             return cls()
         try:
-            data = json.loads(CONFIG_FILE.read_text())
+            data = orjson.loads(CONFIG_FILE.read_bytes())
             return cls.from_dict(data)
-        except (json.JSONDecodeError, IOError):
+        except (orjson.JSONDecodeError, IOError):
             return cls()
 
     def save(self):
         CONFIG_DIR.mkdir(parents=True, exist_ok=True)
-        CONFIG_FILE.write_text(json.dumps(self.to_dict(), ensure_ascii=False, indent=2))
+        _atomic_write_bytes(
+            CONFIG_FILE, orjson.dumps(self.to_dict(), option=orjson.OPT_INDENT_2)
+        )
 
     def get_child_data_dir(self, child_id: int) -> Path:
         """아이별 데이터 폴더 경로를 반환합니다."""
         return CONFIG_DIR / "children" / str(child_id)
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class MediaItem:
     filename: str
     url: str
     folder: str
+    # 다운로드 중 파일마다 Path를 만들지 않도록 "폴더/파일명"을 미리 만들어 둡니다.
+    relpath: str = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self):
+        object.__setattr__(self, "relpath", f"{self.folder}/{self.filename}")
 
     @property
     def path(self) -> Path:
-        return Path(self.folder) / self.filename
+        return Path(self.relpath)
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class DownloadConfig:
     output_dir: Path
     timeout: int = 60
     max_concurrent: int = 20
+    # 이 크기보다 작은 파일은 한 번에 받아 쓰고, 큰 파일은 이만큼 모아서 씁니다.
+    write_buffer_size: int = 1024 * 1024
+    # 이보다 큰 mp4는 Range 요청으로 나눠 여러 연결로 받습니다.
+    segment_threshold: int = 8 * 1024 * 1024
+    segment_size: int = 4 * 1024 * 1024
+    segment_concurrent: int = 4
+
+
+def build_cookie_jar(cookies: list[dict] | None) -> aiohttp.CookieJar:
+    """저장된 브라우저 쿠키를 도메인/경로 정보와 함께 쿠키 저장소에 넣습니다."""
+    # 값을 브라우저가 준 그대로 보내도록 따옴표 처리를 끕니다.
+    jar = aiohttp.CookieJar(quote_cookie=False)
+    for cookie in cookies or []:
+        morsel: Morsel = Morsel()
+        morsel.set(cookie["name"], cookie["value"], cookie["value"])
+        morsel["domain"] = cookie.get("domain", "")
+        morsel["path"] = cookie.get("path", "/")
+        if cookie.get("secure"):
+            morsel["secure"] = True
+        jar.update_cookies({cookie["name"]: morsel})
+    return jar
+
+
+def build_cookie_header(cookies: list[dict]) -> str:
+    return "; ".join(f"{c['name']}={c['value']}" for c in cookies)
+
+
+def create_session(
+    limit: int = 20,
+    cookies: list[dict] | None = None,
+    per_host: int = 0,
+    all_hosts: bool = False,
+) -> aiohttp.ClientSession:
+    """연결 풀과 쿠키를 공유하는 세션을 만듭니다. 이벤트 루프 안에서 호출해야 합니다.
+
+    per_host가 0이면 호스트별 연결 수도 limit까지 허용합니다.
+    all_hosts가 참이면 쿠키를 도메인과 관계없이 모든 요청에 그대로 보냅니다.
+    미디어 CDN이 세션 쿠키를 요구하는지 확인할 수 없어, 다운로드는 이전처럼
+    모든 호스트에 쿠키를 보냅니다.
+    """
+    # TCP_NODELAY는 aiohttp가 연결마다 이미 켜 두므로 따로 설정하지 않습니다.
+    # 유휴 연결을 오래 살려 두어 다음 파일에서 다시 씁니다.
+    connector = aiohttp.TCPConnector(
+        limit=limit,
+        limit_per_host=per_host or limit,
+        ttl_dns_cache=300,
+        keepalive_timeout=120,
+    )
+    if all_hosts and cookies:
+        return aiohttp.ClientSession(
+            connector=connector,
+            cookie_jar=aiohttp.DummyCookieJar(),
+            headers={"Cookie": build_cookie_header(cookies)},
+        )
+    return aiohttp.ClientSession(
+        connector=connector, cookie_jar=build_cookie_jar(cookies)
+    )
 
 
-def parse_media_items(json_data: dict) -> list[MediaItem]:
-    items = []
-    for entry in json_data.get("results", []):
-        try:
-            created_at = datetime.fromisoformat(entry["created"].rstrip("Z"))
-        except (ValueError, KeyError):
-            continue
+@functools.lru_cache(maxsize=4096)
+def _date_folder(date_str: str) -> str | None:
+    """ "YYYY-MM-DD"를 "YYYY/MM/DD" 폴더로 바꿉니다. 형식이 틀리면 None.
 
-        date_str = created_at.strftime("%Y-%m-%d")
-        folder = created_at.strftime("%Y/%m/%d")
+    같은 날짜의 항목이 많으므로 결과를 캐시하고 intern해서, 같은 날짜의
+    MediaItem들이 폴더 문자열 하나를 같이 가리키게 합니다.
+    """
+    if not _ISO_DATE_RE.fullmatch(date_str):
+        return None
+    return sys.intern(f"{date_str[:4]}/{date_str[5:7]}/{date_str[8:10]}")
 
-        for idx, img in enumerate(entry.get("attached_images", [])):
-            if url := img.get("original"):
-                items.append(MediaItem(f"{date_str}-{idx}.jpg", url, folder))
 
+def parse_media_items(json_data: dict) -> list[MediaItem]:
+    """앨범 목록에서 받을 미디어 항목을 만듭니다.
+
+    같은 날짜에 앨범이 여럿이면 파일 이름이 겹치므로 뒤에 이름을 정하는 앨범의
+    파일에는 앨범 id를 붙입니다. list.json은 최신 앨범이 앞에 오므로 오래된
+    앨범부터 이름을 정해, 같은 날 앨범이 새로 올라와도 이미 받은 파일의 이름은
+    바뀌지 않습니다.
+    """
+    results = json_data.get("results", [])
+    used: set[str] = set()
+    per_entry: list[list[MediaItem]] = []
+    for pos in range(len(results) - 1, -1, -1):
+        entry = results[pos]
+        # created는 "YYYY-MM-DDThh:mm:ss..." 형식이라 datetime 없이 잘라서 씁니다.
+        created = entry.get("created") or ""
+        date_str = created[:10]
+        folder = _date_folder(date_str)
+        if folder is None:
+            # 다른 ISO 형식(예: 20260327T100000)일 때만 datetime으로 파싱합니다.
+            try:
+                parsed = datetime.fromisoformat(created.rstrip("Z"))
+            except ValueError:
+                continue
+            date_str = parsed.strftime("%Y-%m-%d")
+            folder = _date_folder(date_str)
+
+        media = [
+            (f"{date_str}-{idx}", ".jpg", url)
+            for idx, img in enumerate(entry.get("attached_images", []))
+            if (url := img.get("original"))
+        ]
         if (video := entry.get("attached_video")) and (url := video.get("high")):
-            items.append(MediaItem(f"{date_str}.mp4", url, folder))
+            media.append((date_str, ".mp4", url))
 
-    return items
+        entry_items = []
+        for stem, ext, url in media:
+            if f"{folder}/{stem}{ext}" in used:
+                stem = f"{stem}-{entry.get('id', len(results) - 1 - pos)}"
+            item = MediaItem(f"{stem}{ext}", url, folder)
+            used.add(item.relpath)
+            entry_items.append(item)
+        per_entry.append(entry_items)
+
+    return [item for entry_items in reversed(per_entry) for item in entry_items]
 
 
 class KidsnoteAuth:
@@ -330,42 +547,73 @@ class KidsnoteAuth:
         self._cookies: list[Any] = []
         self._child_configs: list[ChildConfig] = []
 
-    async def login_interactive(self) -> tuple[list[dict], list[ChildConfig]]:
-        """브라우저를 열어 로그인하고 아이 정보를 자동 감지합니다."""
+    async def login_interactive(
+        self, force_browser: bool = False
+    ) -> tuple[list[dict], list[ChildConfig]]:
+        """브라우저를 열어 로그인하고 아이 정보를 자동 감지합니다.
+
+        저장된 세션이 아직 유효하면 브라우저 없이 아이 정보만 갱신합니다.
+        """
+        if not force_browser:
+            refreshed = await self._try_api_refresh()
+            if refreshed is not None:
+                logger.info(
+                    "저장된 세션이 유효해 브라우저 없이 아이 정보를 갱신했습니다."
+                )
+                logger.info(
+                    "새로 로그인하거나 아이를 추가하려면 --force-browser를 쓰세요."
+                )
+                return self._cookies, refreshed
+
         logger.info("브라우저를 열어 로그인을 진행합니다...")
         logger.info("로그인 후 아이를 선택하고 앨범 페이지로 이동해주세요.")
 
         captured_configs: dict[int, ChildConfig] = {}
+        latest_cookies: list[dict] = []
 
         async def handle_request(request: Request):
             url = request.url
-            if "/api/v1_3/children/" in url and "/albums/" in url:
-                parsed = urlparse(url)
-                qs = parse_qs(parsed.query)
-
-                match = re.search(r"/children/(\d+)/albums/", url)
-                if match:
-                    child_id = int(match.group(1))
-                    center = int(qs.get("center", [0])[0])
-                    cls = int(qs.get("cls", [0])[0])
-
-                    config = ChildConfig(child_id, center, cls)
-                    existing = captured_configs.get(child_id)
-                    merged = config if existing is None else existing.merge(config)
-                    captured_configs[child_id] = merged
-
-                    if existing is None or merged != existing:
-                        logger.info(
-                            f"아이 정보 감지됨: child={child_id}, center={merged.center}, cls={merged.cls}"
-                        )
-                    logger.debug(f"앨범 요청 URL: {url}")
+            # 앞에서부터 맞춰 보므로 앨범 API가 아닌 요청은 첫 몇 글자에서 걸러집니다.
+            match = _CHILD_ALBUM_RE.match(url)
+            if not match:
+                return
+
+            child_id = int(match.group(1))
+            center_match = _CENTER_RE.search(url)
+            cls_match = _CLS_RE.search(url)
+            center = int(center_match.group(1)) if center_match else 0
+            cls = int(cls_match.group(1)) if cls_match else 0
+
+            config = ChildConfig(child_id, center, cls)
+            existing = captured_configs.get(child_id)
+            merged = config if existing is None else existing.merge(config)
+            captured_configs[child_id] = merged
+
+            if existing is None or merged != existing:
+                logger.info(
+                    f"아이 정보 감지됨: child={child_id}, center={merged.center}, cls={merged.cls}"
+                )
+            logger.debug(f"앨범 요청 URL: {url}")
+
+            # 영구 프로필은 창을 닫으면 컨텍스트도 함께 닫히므로,
+            # 로그인된 것이 확인될 때마다 쿠키를 받아 둡니다.
+            latest_cookies[:] = await context.cookies()
 
         async with async_playwright() as p:
-            browser = await p.chromium.launch(headless=False)
-            context = await browser.new_context()
-            page = await context.new_page()
+            # 프로필을 유지해 다음 로그인에서는 브라우저가 빨리 뜨고
+            # 로그인 상태가 남아 있으면 로그인 단계를 건너뛸 수 있습니다.
+            context = await p.chromium.launch_persistent_context(
+                str(BROWSER_PROFILE_DIR), headless=False
+            )
+            page = context.pages[0] if context.pages else await context.new_page()
+
+            # 모든 요청마다 Python으로 이벤트가 넘어오지 않도록
+            # 앨범 API 요청만 가로채고, 요청은 그대로 보냅니다.
+            async def handle_route(route: Route):
+                await route.continue_()
+                await handle_request(route.request)
 
-            page.on("request", handle_request)
+            await page.route(ALBUM_ROUTE_PATTERN, handle_route)
 
             await page.goto(KIDSNOTE_LOGIN_URL)
 
@@ -380,13 +628,16 @@ class KidsnoteAuth:
             except Exception:
                 pass
 
-            self._cookies = await context.cookies()
-            await browser.close()
+            try:
+                self._cookies = await context.cookies()
+            except Exception:
+                self._cookies = list(latest_cookies)
+            await context.close()
 
         # 아이 이름 가져오기 (API 호출)
         configs = list(captured_configs.values())
         if configs and self._cookies:
-            await self._fetch_child_names(configs)
+            configs = await self._fetch_child_names(configs)
 
         self._child_configs = merge_child_configs(configs)
         self._save_session()
@@ -394,32 +645,64 @@ class KidsnoteAuth:
 
         return self._cookies, self._child_configs
 
-    async def _fetch_child_names(self, configs: list[ChildConfig]):
-        """API를 통해 아이 이름을 가져옵니다."""
-        cookie_header = "; ".join(f"{c['name']}={c['value']}" for c in self._cookies)
-        headers = {"Cookie": cookie_header}
+    async def _fetch_child(
+        self, session: aiohttp.ClientSession, config: ChildConfig
+    ) -> tuple[int, ChildConfig]:
+        """아이 정보 API 응답 상태와 이름을 채운 설정을 반환합니다. 실패하면 0."""
+        try:
+            url = KIDSNOTE_CHILD_API.format(child_id=config.child_id)
+            async with session.get(url) as resp:
+                if resp.status != 200:
+                    return resp.status, config
+                data = await resp.json(loads=orjson.loads)
+            if not isinstance(data, dict):
+                raise ValueError(f"예상하지 못한 응답: {type(data).__name__}")
+            name = data.get("name", "")
+        except Exception as e:
+            logger.warning(f"아이 이름 가져오기 실패: {config.child_id} - {e}")
+            return 0, config
+
+        if name:
+            logger.info(f"아이 이름 확인됨: {name} (child={config.child_id})")
+            config = replace(config, name=name)
+        return 200, config
+
+    async def _fetch_children(
+        self, configs: list[ChildConfig]
+    ) -> list[tuple[int, ChildConfig]]:
+        # 아이별 요청을 한 세션에서 동시에 보냅니다.
+        # 동시 연결 수는 세션의 커넥터가 제한합니다.
+        async with create_session(cookies=self._cookies) as session:
+            return list(
+                await asyncio.gather(*(self._fetch_child(session, c) for c in configs))
+            )
 
-        async with aiohttp.ClientSession() as session:
-            for config in configs:
-                try:
-                    url = (
-                        f"https://www.kidsnote.com/api/v1_3/children/{config.child_id}/"
-                    )
-                    async with session.get(url, headers=headers) as resp:
-                        if resp.status == 200:
-                            data = await resp.json()
-                            name = data.get("name", "")
-                            if name:
-                                config.name = name
-                                logger.info(
-                                    f"아이 이름 확인됨: {name} (child={config.child_id})"
-                                )
-                except Exception as e:
-                    logger.warning(f"아이 이름 가져오기 실패: {config.child_id} - {e}")
+    async def _fetch_child_names(self, configs: list[ChildConfig]) -> list[ChildConfig]:
+        """API를 통해 아이 이름을 가져와 이름을 채운 설정 목록을 반환합니다."""
+        return [config for _, config in await self._fetch_children(configs)]
+
+    async def _try_api_refresh(self) -> list[ChildConfig] | None:
+        """저장된 세션으로 아이 정보를 다시 받아 저장합니다.
+
+        세션이 없거나 만료되어 하나라도 200이 아니면 None을 반환합니다.
+        """
+        configs = self.load_config()
+        if not configs or not self.load_session():
+            return None
+
+        results = await self._fetch_children(configs)
+        if any(status != 200 for status, _ in results):
+            return None
+
+        self._child_configs = merge_child_configs([c for _, c in results])
+        self._save_config()
+        return self._child_configs
 
     def _save_session(self):
         CONFIG_DIR.mkdir(parents=True, exist_ok=True)
-        SESSION_FILE.write_text(json.dumps(self._cookies, ensure_ascii=False, indent=2))
+        _atomic_write_bytes(
+            SESSION_FILE, orjson.dumps(self._cookies, option=orjson.OPT_INDENT_2)
+        )
         logger.info(f"세션 저장됨: {SESSION_FILE}")
 
     def _save_config(self):
@@ -433,9 +716,9 @@ class KidsnoteAuth:
         if not SESSION_FILE.exists():
             return None
         try:
-            self._cookies = json.loads(SESSION_FILE.read_text())
+            self._cookies = orjson.loads(SESSION_FILE.read_bytes())
             return self._cookies
-        except (json.JSONDecodeError, IOError):
+        except (orjson.JSONDecodeError, IOError):
             return None
 
     def load_config(self) -> list[ChildConfig]:
@@ -444,94 +727,508 @@ class KidsnoteAuth:
 
 
 class KidsnoteClient:
-    def __init__(self, cookies: list[dict]):
-        self._cookie_header = "; ".join(f"{c['name']}={c['value']}" for c in cookies)
+    """앨범 API 클라이언트. 쿠키는 create_session으로 만든 세션이 보냅니다."""
 
     async def fetch_albums(
-        self, config: ChildConfig, page_size: int = 10000
+        self,
+        session: aiohttp.ClientSession,
+        config: ChildConfig,
+        page_size: int = 10000,
     ) -> tuple[dict, dict]:
         url = KIDSNOTE_ALBUM_API.format(child_id=config.child_id)
-        headers = {"Cookie": self._cookie_header}
-
-        async with aiohttp.ClientSession() as session:
-            results = []
-            request_configs = build_album_request_configs(config, page_size=page_size)
-            for params in request_configs:
-                async with session.get(url, params=params, headers=headers) as resp:
-                    resp.raise_for_status()
-                    data = await resp.json()
-                    results.append(data)
-
-            merged = merge_album_results(results)
-            stats = {
-                "current_count": len(results[0].get("results", []))
-                if len(request_configs) > 1
-                else 0,
-                "past_count": len(results[-1].get("results", [])),
-                "merged_count": len(merged.get("results", [])),
-            }
-            return merged, stats
+
+        results = []
+        request_configs = build_album_request_configs(config, page_size=page_size)
+        for params in request_configs:
+            async with session.get(url, params=params) as resp:
+                resp.raise_for_status()
+                data = await resp.json(loads=orjson.loads)
+            # 목록이나 오류 응답이 오면 merge_album_results에서 터지지 않도록
+            # 아이별 오류 처리가 잡는 ValueError로 바꿉니다.
+            if not isinstance(data, dict) or not isinstance(
+                data.get("results", []), list
+            ):
+                raise ValueError(f"예상하지 못한 앨범 응답: {type(data).__name__}")
+            results.append(data)
+
+        merged = merge_album_results(results)
+        stats = {
+            "current_count": len(results[0].get("results", []))
+            if len(request_configs) > 1
+            else 0,
+            "past_count": len(results[-1].get("results", [])),
+            "merged_count": len(merged.get("results", [])),
+        }
+        return merged, stats
+
+
+def _size_file_name(filename: str) -> str:
+    """이어받기용으로 예상 크기를 적어 두는 파일 이름 (.<이름>.size)"""
+    return f".{filename}.size"
+
+
+def _read_expected_size(size_file: str) -> int:
+    try:
+        fd = os.open(size_file, os.O_RDONLY)
+    except OSError:
+        return 0
+    try:
+        return int(os.read(fd, 32))
+    except (OSError, ValueError):
+        return 0
+    finally:
+        os.close(fd)
+
+
+def _write_expected_size(size_file: str, size: int) -> None:
+    fd = os.open(size_file, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+    try:
+        os.write(fd, str(size).encode())
+    finally:
+        os.close(fd)
+
+
+def _remove(path: str) -> None:
+    try:
+        os.unlink(path)
+    except FileNotFoundError:
+        pass
+
+
+def _resume_offset(filepath: str, size_file: str) -> int | None:
+    """이어받을 위치를 반환합니다. 이미 끝까지 받은 파일이면 None."""
+    try:
+        existing = os.stat(filepath).st_size
+    except FileNotFoundError:
+        return 0
+    # 크기 기록 파일이 없으면 이전에 끝까지 받은 파일입니다.
+    if not os.path.exists(size_file):
+        return None
+    expected_total = _read_expected_size(size_file)
+    if expected_total and existing == expected_total:
+        _remove(size_file)
+        return None
+    return existing if 0 < existing < expected_total else 0
+
+
+def _discard_partial(filepath: str, size_file: str) -> None:
+    """이어받을 수 없는(크기 기록이 없는) 파일만 지웁니다."""
+    if not os.path.exists(size_file):
+        _remove(filepath)
+
+
+def _write_buffers(fd: int, buffers: list[bytes], offset: int | None = None) -> None:
+    """버퍼 여러 개를 writev(pwritev) 한 번으로 씁니다.
+
+    offset이 없으면 현재 위치에, 있으면 그 위치에 씁니다.
+    """
+    if offset is None:
+        written = os.writev(fd, buffers) if hasattr(os, "writev") else 0
+    else:
+        written = os.pwritev(fd, buffers, offset) if hasattr(os, "pwritev") else 0
+
+    # 일부만 쓰였거나 writev가 없는 플랫폼이면 남은 부분을 이어서 씁니다.
+    if written < sum(map(len, buffers)):
+        rest = memoryview(b"".join(buffers))[written:]
+        while rest:
+            if offset is None:
+                n = os.write(fd, rest)
+            else:
+                n = os.pwrite(fd, rest, offset + written)
+            rest = rest[n:]
+            written += n
+
+
+def _write_files(batch: list[tuple[str, bytes]]) -> list[Exception | None]:
+    errors: list[Exception | None] = []
+    for path, data in batch:
+        try:
+            with open(path, "wb") as f:
+                f.write(data)
+            errors.append(None)
+        except OSError as e:
+            errors.append(e)
+    return errors
+
+
+def _make_dirs(paths: list[str]) -> None:
+    for path in paths:
+        os.makedirs(path, exist_ok=True)
+
+
+def _unique_items(
+    items: list[MediaItem],
+) -> tuple[list[MediaItem], int, list[MediaItem]]:
+    """(받을 항목, 같은 URL이라 뺀 개수, 저장 경로가 겹친 항목)을 반환합니다.
+
+    같은 URL은 한 번만 받습니다. URL이 다른데 저장 경로가 겹치면
+    두 워커가 한 파일에 동시에 쓰지 않도록 뒤의 것을 받지 않고 따로 돌려줍니다.
+    """
+    seen_urls: set[str] = set()
+    seen_paths: set[str] = set()
+    unique = []
+    duplicates = 0
+    collisions = []
+    for item in items:
+        if item.url in seen_urls:
+            duplicates += 1
+            continue
+        seen_urls.add(item.url)
+        if item.relpath in seen_paths:
+            collisions.append(item)
+            continue
+        seen_paths.add(item.relpath)
+        unique.append(item)
+    return unique, duplicates, collisions
+
+
+class _RangeIgnoredError(aiohttp.ClientPayloadError):
+    """구간 요청에 서버가 206이 아닌 응답을 보냈을 때"""
+
+
+class FileWriter:
+    """작은 파일 쓰기를 모아서 스레드 풀 호출 한 번으로 처리합니다.
+
+    앞선 묶음을 쓰는 동안 들어온 요청은 다음 묶음으로 함께 씁니다.
+    """
+
+    def __init__(self, max_batch: int = 32):
+        self._max_batch = max_batch
+        self._pending: list[tuple[str, bytes, asyncio.Future]] = []
+        self._flusher: asyncio.Task | None = None
+
+    async def write(self, path: str, data: bytes) -> None:
+        future = asyncio.get_running_loop().create_future()
+        self._pending.append((path, data, future))
+        if self._flusher is None:
+            self._flusher = asyncio.create_task(self._flush())
+        await future
+
+    async def _flush(self) -> None:
+        try:
+            while self._pending:
+                batch = self._pending[: self._max_batch]
+                del self._pending[: self._max_batch]
+                try:
+                    errors = await asyncio.to_thread(
+                        _write_files, [(path, data) for path, data, _ in batch]
+                    )
+                except Exception as e:
+                    errors = [e] * len(batch)
+                for (_, _, future), error in zip(batch, errors):
+                    if future.done():
+                        continue
+                    if error is None:
+                        future.set_result(None)
+                    else:
+                        future.set_exception(error)
+        finally:
+            self._flusher = None
 
 
 class Downloader:
-    def __init__(self, config: DownloadConfig, cookies: list[dict] | None = None):
+    # 플랫폼 기능은 한 번만 확인합니다.
+    # os.pwrite가 없으면(Windows) 분할 다운로드를 쓰지 않습니다.
+    _can_segment = hasattr(os, "pwrite")
+    _can_fadvise = hasattr(os, "posix_fadvise")
+    _can_fallocate = hasattr(os, "posix_fallocate")
+
+    def __init__(self, config: DownloadConfig):
         self.config = config
-        self._semaphore = asyncio.Semaphore(config.max_concurrent)
-        self._cookie_header = ""
-        if cookies:
-            self._cookie_header = "; ".join(
-                f"{c['name']}={c['value']}" for c in cookies
-            )
+        self._writer = FileWriter()
+        # 파일마다 만들지 않도록 미리 만들어 둡니다.
+        self._out_str = str(config.output_dir)
+        self._timeout = aiohttp.ClientTimeout(total=config.timeout)
 
     async def download(self, session: aiohttp.ClientSession, item: MediaItem) -> bool:
-        filepath = self.config.output_dir / item.path
-        if filepath.exists():
+        # 경로는 Path 연산 없이 문자열로 이어 붙입니다.
+        filepath = f"{self._out_str}/{item.relpath}"
+        size_file = f"{self._out_str}/{item.folder}/{_size_file_name(item.filename)}"
+        resume_from = _resume_offset(filepath, size_file)
+        if resume_from is None:
+            return True
+
+        try:
+            if not resume_from and self._can_segment and item.filename.endswith(".mp4"):
+                size = await self._probe_range_size(session, item.url)
+                if size > self.config.segment_threshold:
+                    try:
+                        await self._download_segmented(
+                            session, item.url, filepath, size
+                        )
+                        # 이전 실행이 남긴 크기 기록이 있으면 다음 실행에서
+                        # 다시 받지 않도록 지웁니다.
+                        _remove(size_file)
+                        return True
+                    except _RangeIgnoredError:
+                        # HEAD와 달리 GET에서 Range를 무시하면 한 번에 받습니다.
+                        logger.debug(f"구간 요청 미지원, 한 번에 받습니다: {item.url}")
+
+            # 쿠키는 세션이 붙이므로 이어받을 때만 헤더를 만듭니다.
+            headers = {"Range": f"bytes={resume_from}-"} if resume_from else None
+
+            async with session.get(
+                item.url, timeout=self._timeout, headers=headers
+            ) as resp:
+                if resp.status == 416:
+                    # 기록된 크기가 서버와 다르면 다음 실행에서 처음부터 받습니다.
+                    _remove(filepath)
+                    _remove(size_file)
+                    return False
+                resp.raise_for_status()
+                if resp.status != 206:
+                    # 서버가 Range를 무시하고 전체를 보내면 처음부터 다시 씁니다.
+                    resume_from = 0
+                content_length = int(resp.headers.get("content-length", 0))
+                expected_size = resume_from + content_length if content_length else 0
+                buffer_size = self.config.write_buffer_size
+
+                if not resume_from and 0 < expected_size < buffer_size:
+                    body = await resp.read()
+                    await self._writer.write(filepath, body)
+                    size = len(body)
+                else:
+                    if not resume_from:
+                        _write_expected_size(size_file, expected_size)
+                    flags = os.O_WRONLY | os.O_CREAT | getattr(os, "O_BINARY", 0)
+                    flags |= os.O_APPEND if resume_from else os.O_TRUNC
+                    fd = os.open(filepath, flags, 0o644)
+                    try:
+                        if self._can_fadvise:
+                            os.posix_fadvise(fd, 0, 0, os.POSIX_FADV_SEQUENTIAL)
+                        size = resume_from + await self._stream_to_fd(resp, fd)
+                    finally:
+                        os.close(fd)
+
+                # 쓴 바이트 수를 세어 두었으므로 다시 stat하지 않고 비교합니다.
+                # 끊긴 것이 아니라 크기가 다르면 기록된 크기도 믿을 수 없으므로
+                # 이어받지 않도록 크기 기록까지 지웁니다.
+                if expected_size > 0 and size != expected_size:
+                    logger.error(
+                        f"다운로드 크기 불일치: {item.url} - "
+                        f"{size}바이트 (예상 {expected_size}바이트)"
+                    )
+                    _remove(filepath)
+                    _remove(size_file)
+                    return False
+
+            _remove(size_file)
             return True
 
-        filepath.parent.mkdir(parents=True, exist_ok=True)
+        except (asyncio.TimeoutError, aiohttp.ClientError, IOError) as e:
+            logger.error(f"다운로드 실패: {item.url} - {e}")
+            _discard_partial(filepath, size_file)
+            return False
 
-        async with self._semaphore:
-            try:
-                timeout = aiohttp.ClientTimeout(total=self.config.timeout)
-                headers = {"Cookie": self._cookie_header} if self._cookie_header else {}
-                async with session.get(
-                    item.url, timeout=timeout, headers=headers
-                ) as resp:
-                    resp.raise_for_status()
-                    expected_size = int(resp.headers.get("content-length", 0))
-
-                    async with aiofiles.open(filepath, "wb") as f:
-                        async for chunk in resp.content.iter_chunked(8192):
-                            await f.write(chunk)
-
-                    if expected_size > 0 and filepath.stat().st_size != expected_size:
-                        filepath.unlink(missing_ok=True)
-                        return False
-                    return True
-
-            except (asyncio.TimeoutError, aiohttp.ClientError, IOError) as e:
-                logger.error(f"다운로드 실패: {item.url} - {e}")
-                filepath.unlink(missing_ok=True)
-                return False
-
-    async def run(self, items: list[MediaItem]) -> tuple[int, int]:
-        connector = aiohttp.TCPConnector(
-            limit=self.config.max_concurrent,
-            limit_per_host=10,
+    async def _probe_range_size(self, session: aiohttp.ClientSession, url: str) -> int:
+        """Range 요청을 지원하면 파일 크기를, 아니면 0을 반환합니다.
+
+        확인에 실패해도 파일 전체를 실패시키지 않고 일반 다운로드로 넘깁니다.
+        """
+        try:
+            async with session.head(
+                url, timeout=self._timeout, allow_redirects=True
+            ) as resp:
+                if resp.status != 200 or resp.headers.get("accept-ranges") != "bytes":
+                    return 0
+                return int(resp.headers.get("content-length", 0))
+        except (asyncio.TimeoutError, aiohttp.ClientError, ValueError) as e:
+            logger.debug(f"Range 지원 확인 실패: {url} - {e}")
+            return 0
+
+    async def _download_segmented(
+        self,
+        session: aiohttp.ClientSession,
+        url: str,
+        filepath: str,
+        size: int,
+    ) -> bool:
+        """큰 파일을 구간별로 동시에 받아 미리 잡아둔 파일 위치에 씁니다."""
+        part = filepath + ".part"
+        # 파일 하나가 전체 연결 풀을 차지하지 않도록 구간 동시성을 따로 제한합니다.
+        semaphore = asyncio.Semaphore(self.config.segment_concurrent)
+        step = self.config.segment_size
+
+        fd = os.open(part, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+        try:
+            # 블록을 미리 잡아 조각나지 않게 합니다. 지원하지 않으면 크기만 늘립니다.
+            # .part 파일에만 쓰므로 미리 잡은 크기를 완료로 오인하지 않습니다.
+            if not self._preallocate(fd, size):
+                os.ftruncate(fd, size)
+            results = await asyncio.gather(
+                *(
+                    self._fetch_segment(
+                        session,
+                        url,
+                        fd,
+                        start,
+                        min(start + step, size) - 1,
+                        semaphore,
+                    )
+                    for start in range(0, size, step)
+                ),
+                return_exceptions=True,
+            )
+            for result in results:
+                if isinstance(result, BaseException):
+                    raise result
+            await asyncio.to_thread(os.fsync, fd)
+        except BaseException:
+            os.close(fd)
+            _remove(part)
+            raise
+
+        os.close(fd)
+        os.replace(part, filepath)
+        return True
+
+    def _preallocate(self, fd: int, size: int) -> bool:
+        if not self._can_fallocate:
+            return False
+        try:
+            os.posix_fallocate(fd, 0, size)
+        except OSError:
+            return False
+        return True
+
+    async def _fetch_segment(
+        self,
+        session: aiohttp.ClientSession,
+        url: str,
+        fd: int,
+        start: int,
+        end: int,
+        semaphore: asyncio.Semaphore,
+    ) -> None:
+        async with semaphore:
+            async with session.get(
+                url,
+                timeout=self._timeout,
+                headers={"Range": f"bytes={start}-{end}"},
+            ) as resp:
+                resp.raise_for_status()
+                if resp.status != 206:
+                    raise _RangeIgnoredError(
+                        f"Range 요청이 무시됨 (HTTP {resp.status})"
+                    )
+
+                received = await self._stream_to_fd(resp, fd, offset=start)
+                if received != end - start + 1:
+                    raise aiohttp.ClientPayloadError(
+                        f"구간 크기 불일치: {start}-{end}, {received}바이트 수신"
+                    )
+
+    async def _stream_to_fd(
+        self, resp: aiohttp.ClientResponse, fd: int, offset: int | None = None
+    ) -> int:
+        """응답 본문을 버퍼 단위로 모아 fd에 쓰고, 쓴 바이트 수를 반환합니다.
+
+        offset이 주어지면 그 위치부터 쓰므로 구간 다운로드끼리 seek하지 않습니다.
+        """
+        written = 0
+        buffers: list[bytes] = []
+        buffered = 0
+        async for chunk in resp.content.iter_chunked(READ_CHUNK_SIZE):
+            buffers.append(chunk)
+            buffered += len(chunk)
+            if (
+                buffered < self.config.write_buffer_size
+                and len(buffers) < MAX_WRITE_BUFFERS
+            ):
+                continue
+            position = None if offset is None else offset + written
+            await asyncio.to_thread(_write_buffers, fd, buffers, position)
+            written += buffered
+            buffers, buffered = [], 0
+
+        if buffers:
+            position = None if offset is None else offset + written
+            await asyncio.to_thread(_write_buffers, fd, buffers, position)
+            written += buffered
+        return written
+
+    def filter_pending(self, items: list[MediaItem]) -> list[MediaItem]:
+        """이미 끝까지 받은 파일을 빼고 받을 파일만 반환합니다.
+
+        파일마다 stat하지 않고 날짜 폴더마다 scandir을 한 번만 합니다.
+        """
+        listings: dict[str, set[str]] = {}
+        pending = []
+        for item in items:
+            names = listings.get(item.folder)
+            if names is None:
+                try:
+                    with os.scandir(f"{self._out_str}/{item.folder}") as it:
+                        names = {entry.name for entry in it}
+                except OSError:
+                    names = set()
+                listings[item.folder] = names
+
+            # 크기 기록 파일이 남아 있으면 이어받아야 하는 파일입니다.
+            if item.filename not in names or _size_file_name(item.filename) in names:
+                pending.append(item)
+        return pending
+
+    async def run(
+        self, session: aiohttp.ClientSession, items: list[MediaItem]
+    ) -> tuple[int, int]:
+        """받을 파일을 내려받고 (성공, 실패) 개수를 반환합니다.
+
+        이미 받아 둔 파일과 URL이 같아 한 번만 받은 파일은 성공으로,
+        저장 경로가 겹쳐 받지 못한 파일은 실패로 셉니다.
+        """
+        unique, duplicates, collisions = _unique_items(items)
+        if duplicates:
+            logger.info(f"URL이 같은 파일 {duplicates}개는 한 번만 받습니다")
+        for item in collisions:
+            logger.error(f"저장 경로가 겹쳐 받지 못함: {item.relpath} - {item.url}")
+        pending = self.filter_pending(unique)
+        skipped = len(unique) - len(pending)
+        if skipped:
+            logger.info(f"이미 받은 파일 {skipped}개는 건너뜁니다")
+
+        # 날짜 폴더는 파일마다가 아니라 한 번씩만, 이벤트 루프 밖에서 만듭니다.
+        # 짧은 경로부터 만들면 상위 폴더가 먼저 생겨 makedirs가 덜 거슬러 올라갑니다.
+        folders = sorted(
+            {f"{self._out_str}/{item.folder}" for item in pending}, key=len
         )
-        async with aiohttp.ClientSession(connector=connector) as session:
-            tasks = [self.download(session, item) for item in items]
-            results = await tqdm.gather(*tasks, desc="다운로드 중", unit="파일")
+        await asyncio.to_thread(_make_dirs, folders)
 
-        success = sum(results)
-        return success, len(results) - success
+        # 같은 호스트, 같은 날짜 폴더의 파일이 이어서 나오도록 정렬해
+        # keep-alive 연결과 디렉터리 캐시를 재사용합니다.
+        pending.sort(key=lambda item: (urlsplit(item.url).netloc, item.folder))
+
+        # 파일마다 Task를 만들지 않고, 동시 다운로드 수만큼의 워커가
+        # 같은 이터레이터에서 다음 파일을 꺼내 갑니다.
+        queue = iter(pending)
+        success = 0
+
+        with tqdm(total=len(pending), desc="다운로드 중", unit="파일") as pbar:
+
+            async def worker():
+                nonlocal success
+                for item in queue:
+                    ok = await self.download(session, item)
+                    success += ok
+                    pbar.update(1)
+
+            workers = min(self.config.max_concurrent, len(pending))
+            await asyncio.gather(*(worker() for _ in range(workers)))
+
+        failed = len(pending) - success + len(collisions)
+        return skipped + duplicates + success, failed
 
 
 @app.command()
-def login():
+def login(
+    force_browser: Annotated[
+        bool,
+        typer.Option("--force-browser", help="저장된 세션이 있어도 브라우저로 로그인"),
+    ] = False,
+):
     """브라우저를 열어 키즈노트에 로그인하고 아이 정보를 자동 감지합니다."""
     auth = KidsnoteAuth()
-    cookies, configs = asyncio.run(auth.login_interactive())
+    cookies, configs = run_async(auth.login_interactive(force_browser))
 
     if not cookies:
         logger.error("로그인 실패")
@@ -578,7 +1275,7 @@ def list_children():
         status = ""
         if list_file.exists():
             try:
-                data = json.loads(list_file.read_text())
+                data = orjson.loads(list_file.read_bytes())
                 results = data.get("results", [])
                 # 미디어 개수 계산
                 media_count = sum(
@@ -587,7 +1284,7 @@ def list_children():
                     for r in results
                 )
                 status = f" - 앨범 {len(results)}개, 미디어 {media_count}개"
-            except (json.JSONDecodeError, IOError):
+            except (orjson.JSONDecodeError, IOError):
                 status = " - list.json 오류"
         else:
             status = " - fetch 필요"
@@ -657,25 +1354,30 @@ def get_album_stats(data: dict) -> str:
     if not results:
         return "0개"
 
-    media_count = sum(
-        len(r.get("attached_images", [])) + (1 if r.get("attached_video") else 0)
-        for r in results
-    )
-
-    # 날짜 범위 계산
-    dates = []
+    # 미디어 개수와 날짜 범위를 한 번의 순회로 계산
+    media_count = 0
+    oldest = newest = None
     for r in results:
+        media_count += len(r.get("attached_images", [])) + (
+            1 if r.get("attached_video") else 0
+        )
+        created = r.get("created", "")
+        if not created:
+            continue
         try:
-            created = r.get("created", "")
-            if created:
-                dates.append(datetime.fromisoformat(created.rstrip("Z")))
+            dt = datetime.fromisoformat(created.rstrip("Z"))
         except ValueError:
-            pass
-
-    if dates:
-        oldest = min(dates).strftime("%Y-%m-%d")
-        newest = max(dates).strftime("%Y-%m-%d")
-        return f"앨범 {len(results)}개, 미디어 {media_count}개 ({oldest} ~ {newest})"
+            continue
+        if oldest is None or dt < oldest:
+            oldest = dt
+        if newest is None or dt > newest:
+            newest = dt
+
+    if oldest is not None:
+        return (
+            f"앨범 {len(results)}개, 미디어 {media_count}개 "
+            f"({oldest:%Y-%m-%d} ~ {newest:%Y-%m-%d})"
+        )
 
     return f"앨범 {len(results)}개, 미디어 {media_count}개"
 
@@ -707,28 +1409,48 @@ def fetch(
         logger.error(f"잘못된 인덱스입니다. 0~{len(configs) - 1} 사이로 지정하세요.")
         raise typer.Exit(1)
 
-    client = KidsnoteClient(cookies)
+    client = KidsnoteClient()
 
-    for idx, config in targets_with_index:
+    async def _fetch_child(
+        session: aiohttp.ClientSession, idx: int, config: ChildConfig
+    ) -> bool:
         label = get_child_label(config, idx)
         logger.info(f"{label} 앨범 가져오는 중...")
+        # 한 아이의 실패가 gather 전체를 멈추지 않도록 아이별로 처리합니다.
+        try:
+            data, fetch_stats = await client.fetch_albums(session, config)
+        except (aiohttp.ClientError, asyncio.TimeoutError, ValueError) as e:
+            logger.error(f"{label} API 호출 실패: {e!r}")
+            return False
 
-        async def _fetch():
-            return await client.fetch_albums(config)
-
+        child_dir = get_child_data_dir(config.child_id)
+        output = child_dir / "list.json"
         try:
-            data, fetch_stats = asyncio.run(_fetch())
-            child_dir = get_child_data_dir(config.child_id)
             child_dir.mkdir(parents=True, exist_ok=True)
-            output = child_dir / "list.json"
-            output.write_text(json.dumps(data, ensure_ascii=False, indent=2))
-            logger.info(
-                f"앨범 목록 저장됨: {output} ({get_album_stats(data)}, "
-                f"{format_album_fetch_stats(**fetch_stats)})"
+            _atomic_write_bytes(output, orjson.dumps(data, option=orjson.OPT_INDENT_2))
+        except OSError as e:
+            logger.error(f"{label} 앨범 목록 저장 실패: {e}")
+            return False
+        logger.info(
+            f"앨범 목록 저장됨: {output} ({get_album_stats(data)}, "
+            f"{format_album_fetch_stats(**fetch_stats)})"
+        )
+        return True
+
+    async def _main() -> bool:
+        # 모든 아이의 앨범을 하나의 세션(연결 풀)에서 동시에 가져옵니다.
+        # 한 아이가 실패해도 나머지 아이의 목록은 저장합니다.
+        async with create_session(cookies=cookies) as session:
+            results = await asyncio.gather(
+                *(
+                    _fetch_child(session, idx, config)
+                    for idx, config in targets_with_index
+                )
             )
-        except aiohttp.ClientError as e:
-            logger.error(f"API 호출 실패: {e}")
-            raise typer.Exit(1)
+        return all(results)
+
+    if not run_async(_main()):
+        raise typer.Exit(1)
 
 
 @app.command()
@@ -748,6 +1470,10 @@ def download(
     concurrent: Annotated[
         int, typer.Option("--concurrent", "-c", help="최대 동시 다운로드 수")
     ] = 20,
+    per_host: Annotated[
+        int,
+        typer.Option("--per-host", help="호스트별 최대 연결 수 (0: 동시 다운로드 수)"),
+    ] = 0,
     dry_run: Annotated[
         bool, typer.Option("--dry-run", help="다운로드 없이 파일 목록만 출력")
     ] = False,
@@ -781,53 +1507,61 @@ def download(
         raise typer.Exit(1)
 
     logger.info(f"다운로드 경로: {output_base}")
-    total_success, total_failed = 0, 0
 
-    for idx, config in targets_with_index:
-        label = get_child_label(config, idx)
-        child_dir = get_child_data_dir(config.child_id)
-        input_file = child_dir / "list.json"
+    def _iter_jobs():
+        # 아이별 list.json은 그 아이를 받기 직전에 읽어서,
+        # 한 번에 한 아이의 목록만 메모리에 둡니다.
+        for idx, config in targets_with_index:
+            label = get_child_label(config, idx)
+            child_dir = get_child_data_dir(config.child_id)
+            input_file = child_dir / "list.json"
 
-        if not input_file.exists():
-            logger.warning(f"{label} list.json이 없습니다. fetch를 먼저 실행하세요.")
-            continue
+            if not input_file.exists():
+                logger.warning(
+                    f"{label} list.json이 없습니다. fetch를 먼저 실행하세요."
+                )
+                continue
 
-        try:
-            with open(input_file, encoding="utf-8") as f:
-                items = parse_media_items(json.load(f))
-        except (FileNotFoundError, json.JSONDecodeError) as e:
-            logger.error(f"입력 파일 로드 실패: {e}")
-            continue
+            try:
+                items = parse_media_items(orjson.loads(input_file.read_bytes()))
+            except (FileNotFoundError, orjson.JSONDecodeError) as e:
+                logger.error(f"입력 파일 로드 실패: {e}")
+                continue
 
-        if not items:
-            logger.warning(f"{label} 다운로드할 파일이 없습니다")
-            continue
+            if not items:
+                logger.warning(f"{label} 다운로드할 파일이 없습니다")
+                continue
 
-        logger.info(f"{label} 총 {len(items)}개 파일 발견")
+            logger.info(f"{label} 총 {len(items)}개 파일 발견")
 
-        # 아이별 폴더로 다운로드 (이름이 있으면 이름 사용)
-        folder_name = config.name if config.name else str(config.child_id)
-        child_output = output_base / folder_name
+            # 아이별 폴더로 다운로드 (이름이 있으면 이름 사용)
+            folder_name = config.name if config.name else str(config.child_id)
+            yield label, output_base / folder_name, items
 
-        if dry_run:
+    if dry_run:
+        for _, child_output, items in _iter_jobs():
             for item in items:
                 typer.echo(f"  {child_output / item.path}")
-            continue
-
-        dl_config = DownloadConfig(child_output, timeout, concurrent)
-
-        async def _download():
-            dl_config.output_dir.mkdir(parents=True, exist_ok=True)
-            return await Downloader(dl_config, cookies).run(items)
-
-        success, failed = asyncio.run(_download())
-        total_success += success
-        total_failed += failed
-
-        logger.info(f"{label} 완료: {success}개 성공, {failed}개 실패")
-
-    if not dry_run:
-        logger.info(f"전체 완료: {total_success}개 성공, {total_failed}개 실패")
+        raise typer.Exit(0)
+
+    async def _main() -> tuple[int, int]:
+        total_success, total_failed = 0, 0
+        # 이벤트 루프, DNS 캐시, 연결 풀을 모든 아이가 같이 씁니다.
+        async with create_session(
+            concurrent, cookies, per_host, all_hosts=True
+        ) as session:
+            for label, child_output, items in _iter_jobs():
+                child_output.mkdir(parents=True, exist_ok=True)
+                dl_config = DownloadConfig(child_output, timeout, concurrent)
+                success, failed = await Downloader(dl_config).run(session, items)
+                total_success += success
+                total_failed += failed
+
+                logger.info(f"{label} 완료: {success}개 성공, {failed}개 실패")
+        return total_success, total_failed
+
+    total_success, total_failed = run_async(_main())
+    logger.info(f"전체 완료: {total_success}개 성공, {total_failed}개 실패")
 
     raise typer.Exit(0 if total_failed == 0 else 1)
 
@@ -0,0 +1,83 @@
+import unittest
+from unittest import mock
+
+from aiohttp import web
+from aiohttp.test_utils import TestServer
+
+from kd import cli
+from kd.cli import ChildConfig, KidsnoteAuth
+
+CONFIGS = [ChildConfig(1, 10, 100), ChildConfig(2, 20, 200)]
+
+
+class BrowserLaunched(Exception):
+    pass
+
+
+class LoginTests(unittest.IsolatedAsyncioTestCase):
+    async def asyncSetUp(self):
+        self.status = 200
+        self.payloads = {
+            "1": {"id": 1, "name": "첫째"},
+            "2": {"id": 2, "name": "둘째"},
+        }
+
+        async def handler(request):
+            if self.status != 200:
+                return web.json_response({"detail": "login"}, status=self.status)
+            return web.json_response(self.payloads[request.match_info["child_id"]])
+
+        app = web.Application()
+        app.router.add_get("/children/{child_id}/", handler)
+        self.server = TestServer(app)
+        await self.server.start_server()
+        self.addAsyncCleanup(self.server.close)
+
+        self.auth = KidsnoteAuth()
+        self.saved: list[list[ChildConfig]] = []
+        url = str(self.server.make_url("/")) + "children/{child_id}/"
+        load_session = mock.Mock(return_value=[{"name": "sessionid", "value": "x"}])
+        save_config = mock.Mock(
+            side_effect=lambda: self.saved.append(self.auth._child_configs)
+        )
+        for patcher in (
+            mock.patch.object(cli, "KIDSNOTE_CHILD_API", url),
+            mock.patch.object(cli, "async_playwright", side_effect=BrowserLaunched),
+            mock.patch.object(self.auth, "load_config", return_value=CONFIGS),
+            mock.patch.object(self.auth, "load_session", load_session),
+            mock.patch.object(self.auth, "_save_config", save_config),
+        ):
+            patcher.start()
+            self.addCleanup(patcher.stop)
+
+    async def test_valid_session_refreshes_without_browser(self):
+        _, configs = await self.auth.login_interactive()
+
+        self.assertEqual([c.name for c in configs], ["첫째", "둘째"])
+        self.assertEqual(self.saved, [configs])
+
+    async def test_expired_session_opens_browser(self):
+        self.status = 401
+
+        with self.assertRaises(BrowserLaunched):
+            await self.auth.login_interactive()
+        self.assertEqual(self.saved, [])
+
+    async def test_force_browser_skips_refresh(self):
+        with self.assertRaises(BrowserLaunched):
+            await self.auth.login_interactive(force_browser=True)
+        self.assertEqual(self.saved, [])
+
+    async def test_unexpected_json_falls_back_to_browser(self):
+        self.payloads["2"] = ["not", "a", "dict"]
+
+        with self.assertRaises(BrowserLaunched):
+            await self.auth.login_interactive()
+        self.assertEqual(self.saved, [])
+
+    async def test_unexpected_json_keeps_config_without_name(self):
+        self.payloads["1"] = None
+
+        configs = await self.auth._fetch_child_names(CONFIGS)
+
+        self.assertEqual([c.name for c in configs], ["", "둘째"])
@@ -0,0 +1,350 @@
+import asyncio
+import gzip
+import os
+import tempfile
+import unittest
+from pathlib import Path
+
+import aiohttp
+from aiohttp import web
+from aiohttp.test_utils import TestServer
+
+from kd.cli import (
+    DownloadConfig,
+    Downloader,
+    FileWriter,
+    MediaItem,
+    _unique_items,
+    _write_buffers,
+)
+
+
+class FilterPendingTests(unittest.TestCase):
+    def test_skips_complete_files_and_keeps_partial_ones(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            root = Path(tmp)
+            folder = root / "2026" / "03" / "27"
+            folder.mkdir(parents=True)
+            (folder / "done.jpg").write_bytes(b"done")
+            (folder / "partial.mp4").write_bytes(b"part")
+            (folder / ".partial.mp4.size").write_text("100")
+
+            items = [
+                MediaItem("done.jpg", "https://example.com/1", "2026/03/27"),
+                MediaItem("partial.mp4", "https://example.com/2", "2026/03/27"),
+                MediaItem("new.jpg", "https://example.com/3", "2026/03/27"),
+                MediaItem("other.jpg", "https://example.com/4", "2026/03/28"),
+            ]
+            pending = Downloader(DownloadConfig(root)).filter_pending(items)
+
+        self.assertEqual(
+            [item.filename for item in pending],
+            ["partial.mp4", "new.jpg", "other.jpg"],
+        )
+
+
+class UniqueItemsTests(unittest.TestCase):
+    def test_drops_repeated_urls_and_reports_path_collisions(self):
+        items = [
+            MediaItem("2026-03-27-0.jpg", "https://example.com/1", "2026/03/27"),
+            MediaItem("2026-03-27-1.jpg", "https://example.com/1", "2026/03/27"),
+            MediaItem("2026-03-27-0.jpg", "https://example.com/2", "2026/03/27"),
+            MediaItem("2026-03-27-1.jpg", "https://example.com/3", "2026/03/27"),
+        ]
+
+        unique, duplicates, collisions = _unique_items(items)
+
+        self.assertEqual(
+            [(item.filename, item.url) for item in unique],
+            [
+                ("2026-03-27-0.jpg", "https://example.com/1"),
+                ("2026-03-27-1.jpg", "https://example.com/3"),
+            ],
+        )
+        self.assertEqual(duplicates, 1)
+        self.assertEqual(
+            [(item.filename, item.url) for item in collisions],
+            [("2026-03-27-0.jpg", "https://example.com/2")],
+        )
+
+
+class FileWriterTests(unittest.IsolatedAsyncioTestCase):
+    async def test_writes_concurrent_requests_and_reports_errors(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            root = Path(tmp)
+            writer = FileWriter(max_batch=2)
+            results = await asyncio.gather(
+                writer.write(root / "a.jpg", b"a"),
+                writer.write(root / "b.jpg", b"b"),
+                writer.write(root / "c.jpg", b"c"),
+                writer.write(root / "missing" / "d.jpg", b"d"),
+                return_exceptions=True,
+            )
+
+            self.assertEqual(results[:3], [None, None, None])
+            self.assertIsInstance(results[3], FileNotFoundError)
+            self.assertEqual((root / "c.jpg").read_bytes(), b"c")
+
+
+class WriteBuffersTests(unittest.TestCase):
+    def test_appends_and_writes_at_offset(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            path = Path(tmp) / "file.bin"
+            fd = os.open(path, os.O_RDWR | os.O_CREAT)
+            try:
+                _write_buffers(fd, [b"abc", b"def"])
+                _write_buffers(fd, [b"XY", b"Z"], offset=1)
+            finally:
+                os.close(fd)
+
+            self.assertEqual(path.read_bytes(), b"aXYZef")
+
+
+VIDEO = bytes(range(256)) * 400
+
+
+class LocalServerTestCase(unittest.IsolatedAsyncioTestCase):
+    """로컬 aiohttp 서버로 Downloader.download를 확인합니다."""
+
+    async def asyncSetUp(self):
+        tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp.cleanup)
+        self.root = Path(tmp.name)
+        (self.root / "2026" / "03" / "27").mkdir(parents=True)
+        self.requests: list[tuple[str, str | None]] = []
+
+    async def start(self, routes: list[web.RouteDef]) -> None:
+        @web.middleware
+        async def record(request, handler):
+            self.requests.append((request.method, request.headers.get("Range")))
+            return await handler(request)
+
+        app = web.Application(middlewares=[record])
+        app.add_routes(routes)
+        self.server = TestServer(app)
+        await self.server.start_server()
+        self.addAsyncCleanup(self.server.close)
+        self.session = aiohttp.ClientSession()
+        self.addAsyncCleanup(self.session.close)
+
+    def downloader(self, **overrides) -> Downloader:
+        options = {
+            "timeout": 5,
+            "write_buffer_size": 1024,
+            "segment_threshold": 10_000,
+            "segment_size": 30_000,
+        }
+        options.update(overrides)
+        return Downloader(DownloadConfig(self.root, **options))
+
+    def item(self, filename: str, path: str = "/file") -> MediaItem:
+        return MediaItem(filename, str(self.server.make_url(path)), "2026/03/27")
+
+    def stored(self, name: str) -> Path:
+        return self.root / "2026" / "03" / "27" / name
+
+
+class SegmentedDownloadTests(LocalServerTestCase):
+    async def serve_file(self, request):
+        return web.FileResponse(self.source)
+
+    async def asyncSetUp(self):
+        await super().asyncSetUp()
+        self.source = self.root / "source.mp4"
+        self.source.write_bytes(VIDEO)
+
+    async def test_downloads_large_video_in_ranges(self):
+        await self.start([web.get("/file", self.serve_file)])
+
+        ok = await self.downloader().download(self.session, self.item("v.mp4"))
+
+        self.assertTrue(ok)
+        self.assertEqual(self.stored("v.mp4").read_bytes(), VIDEO)
+        self.assertFalse(self.stored("v.mp4.part").exists())
+        self.assertEqual(
+            self.requests,
+            [
+                ("HEAD", None),
+                ("GET", "bytes=0-29999"),
+                ("GET", "bytes=30000-59999"),
+                ("GET", "bytes=60000-89999"),
+                ("GET", "bytes=90000-102399"),
+            ],
+        )
+
+    async def test_falls_back_when_get_ignores_range(self):
+        async def head(request):
+            return web.Response(
+                headers={"Accept-Ranges": "bytes", "Content-Length": str(len(VIDEO))}
+            )
+
+        async def get(request):
+            return web.Response(body=VIDEO)
+
+        await self.start(
+            [web.head("/file", head), web.get("/file", get, allow_head=False)]
+        )
+
+        ok = await self.downloader().download(self.session, self.item("v.mp4"))
+
+        self.assertTrue(ok)
+        self.assertEqual(self.stored("v.mp4").read_bytes(), VIDEO)
+        self.assertFalse(self.stored("v.mp4.part").exists())
+        self.assertEqual(self.requests[-1], ("GET", None))
+
+    async def test_streams_whole_file_without_range_support(self):
+        async def get(request):
+            return web.Response(body=VIDEO)
+
+        await self.start([web.get("/file", get)])
+
+        ok = await self.downloader().download(self.session, self.item("v.mp4"))
+
+        self.assertTrue(ok)
+        self.assertEqual(self.stored("v.mp4").read_bytes(), VIDEO)
+        self.assertEqual(self.requests, [("HEAD", None), ("GET", None)])
+
+    async def test_probe_failure_falls_back_to_plain_get(self):
+        async def head(request):
+            request.transport.close()
+            return web.Response()
+
+        await self.start(
+            [
+                web.head("/file", head),
+                web.get("/file", self.serve_file, allow_head=False),
+            ]
+        )
+
+        ok = await self.downloader().download(self.session, self.item("v.mp4"))
+
+        self.assertTrue(ok)
+        self.assertEqual(self.stored("v.mp4").read_bytes(), VIDEO)
+        self.assertEqual(self.requests[-1], ("GET", None))
+
+
+class ResumeDownloadTests(LocalServerTestCase):
+    def write_partial(self, name: str, data: bytes, total: int) -> None:
+        self.stored(name).write_bytes(data)
+        self.stored(f".{name}.size").write_text(str(total))
+
+    async def test_resumes_partial_file_with_range(self):
+        source = self.root / "source.jpg"
+        source.write_bytes(VIDEO)
+
+        async def get(request):
+            return web.FileResponse(source)
+
+        await self.start([web.get("/file", get)])
+        self.write_partial("p.jpg", VIDEO[:40_000], len(VIDEO))
+
+        ok = await self.downloader().download(self.session, self.item("p.jpg"))
+
+        self.assertTrue(ok)
+        self.assertEqual(self.stored("p.jpg").read_bytes(), VIDEO)
+        self.assertFalse(self.stored(".p.jpg.size").exists())
+        self.assertEqual(self.requests, [("GET", "bytes=40000-")])
+
+    async def test_rewrites_from_start_when_server_ignores_range(self):
+        async def get(request):
+            return web.Response(body=VIDEO)
+
+        await self.start([web.get("/file", get)])
+        self.write_partial("p.jpg", VIDEO[:40_000], len(VIDEO))
+
+        ok = await self.downloader().download(self.session, self.item("p.jpg"))
+
+        self.assertTrue(ok)
+        self.assertEqual(self.stored("p.jpg").read_bytes(), VIDEO)
+        self.assertFalse(self.stored(".p.jpg.size").exists())
+
+    async def test_range_not_satisfiable_removes_file_and_size_record(self):
+        async def get(request):
+            return web.Response(status=416)
+
+        await self.start([web.get("/file", get)])
+        self.write_partial("p.jpg", VIDEO[:40_000], len(VIDEO))
+
+        ok = await self.downloader().download(self.session, self.item("p.jpg"))
+
+        self.assertFalse(ok)
+        self.assertFalse(self.stored("p.jpg").exists())
+        self.assertFalse(self.stored(".p.jpg.size").exists())
+
+    async def test_length_mismatch_discards_file(self):
+        # Content-Length는 압축된 크기라 풀어서 쓴 크기와 달라집니다.
+        async def get(request):
+            return web.Response(
+                body=gzip.compress(VIDEO), headers={"Content-Encoding": "gzip"}
+            )
+
+        await self.start([web.get("/file", get)])
+
+        ok = await self.downloader(write_buffer_size=256).download(
+            self.session, self.item("p.jpg")
+        )
+
+        self.assertFalse(ok)
+        self.assertFalse(self.stored("p.jpg").exists())
+        self.assertFalse(self.stored(".p.jpg.size").exists())
+
+    async def test_segmented_download_clears_stale_size_record(self):
+        # 길이 없이 끊긴 GET이 남긴 0 기록은 파일 크기와 맞지 않아 처음부터 받습니다.
+        source = self.root / "source.mp4"
+        source.write_bytes(VIDEO)
+
+        async def get(request):
+            return web.FileResponse(source)
+
+        await self.start([web.get("/file", get)])
+        self.write_partial("v.mp4", VIDEO[:5_000], 0)
+        downloader = self.downloader()
+        item = self.item("v.mp4")
+
+        ok = await downloader.download(self.session, item)
+
+        self.assertTrue(ok)
+        self.assertEqual(self.stored("v.mp4").read_bytes(), VIDEO)
+        self.assertFalse(self.stored(".v.mp4.size").exists())
+        self.assertEqual(downloader.filter_pending([item]), [])
+
+    async def test_interrupted_stream_keeps_partial_file_for_resume(self):
+        async def get(request):
+            resp = web.StreamResponse()
+            resp.content_length = len(VIDEO)
+            await resp.prepare(request)
+            await resp.write(VIDEO[:50_000])
+            request.transport.close()
+            return resp
+
+        await self.start([web.get("/file", get)])
+
+        ok = await self.downloader().download(self.session, self.item("p.jpg"))
+
+        self.assertFalse(ok)
+        self.assertTrue(self.stored("p.jpg").exists())
+        self.assertLess(self.stored("p.jpg").stat().st_size, len(VIDEO))
+        self.assertEqual(self.stored(".p.jpg.size").read_text(), str(len(VIDEO)))
+
+
+class RunTests(LocalServerTestCase):
+    async def test_counts_duplicate_urls_as_done_and_path_collisions_as_failed(self):
+        async def get(request):
+            return web.Response(body=request.path.encode())
+
+        await self.start([web.get("/{name}", get)])
+        items = [
+            self.item("2026-03-27-0.jpg", "/a"),
+            self.item("2026-03-27-1.jpg", "/a"),
+            self.item("2026-03-27-0.jpg", "/b"),
+        ]
+
+        result = await self.downloader().run(self.session, items)
+
+        self.assertEqual(result, (2, 1))
+        self.assertEqual(self.stored("2026-03-27-0.jpg").read_bytes(), b"/a")
+        self.assertEqual(self.requests, [("GET", None)])
+
+
+if __name__ == "__main__":
+    unittest.main()
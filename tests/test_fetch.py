@@ -0,0 +1,75 @@
+import asyncio
+import tempfile
+import unittest
+from pathlib import Path
+from unittest import mock
+
+import orjson
+from aiohttp import web
+from aiohttp.test_utils import TestServer
+from typer.testing import CliRunner
+
+from kd import cli
+from kd.cli import ChildConfig
+
+CONFIGS = [ChildConfig(1, 10, 100), ChildConfig(2, 20, 200)]
+
+
+class FetchCommandTests(unittest.IsolatedAsyncioTestCase):
+    async def asyncSetUp(self):
+        self.bodies = {
+            "1": {"results": [{"id": 1, "created": "2024-01-01T00:00:00"}]},
+            "2": {"results": [{"id": 2, "created": "2024-01-02T00:00:00"}]},
+        }
+
+        async def handler(request):
+            return web.json_response(self.bodies[request.match_info["child_id"]])
+
+        app = web.Application()
+        app.router.add_get("/children/{child_id}/albums/", handler)
+        self.server = TestServer(app)
+        await self.server.start_server()
+        self.addAsyncCleanup(self.server.close)
+
+        tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp.cleanup)
+        self.config_dir = Path(tmp.name)
+        url = str(self.server.make_url("/")) + "children/{child_id}/albums/"
+        for patcher in (
+            mock.patch.object(cli, "KIDSNOTE_ALBUM_API", url),
+            mock.patch.object(cli, "CONFIG_DIR", self.config_dir),
+            mock.patch.object(
+                cli.KidsnoteAuth,
+                "load_session",
+                return_value=[{"name": "sessionid", "value": "x"}],
+            ),
+            mock.patch.object(cli.KidsnoteAuth, "load_config", return_value=CONFIGS),
+        ):
+            patcher.start()
+            self.addCleanup(patcher.stop)
+
+    async def invoke_fetch(self):
+        # 명령은 자체 이벤트 루프를 돌리므로 테스트 서버 루프와 다른 스레드에서 실행합니다.
+        return await asyncio.to_thread(CliRunner().invoke, cli.app, ["fetch"])
+
+    def saved(self, child_id: int) -> Path:
+        return self.config_dir / "children" / str(child_id) / "list.json"
+
+    async def test_saves_album_list_for_each_child(self):
+        result = await self.invoke_fetch()
+
+        self.assertEqual(result.exit_code, 0, result.output)
+        for child_id in (1, 2):
+            data = orjson.loads(self.saved(child_id).read_bytes())
+            self.assertEqual([e["id"] for e in data["results"]], [child_id])
+
+    async def test_non_object_response_fails_only_that_child(self):
+        self.bodies["1"] = ["x"]
+
+        result = await self.invoke_fetch()
+
+        self.assertEqual(result.exit_code, 1)
+        self.assertIsInstance(result.exception, SystemExit)
+        self.assertFalse(self.saved(1).exists())
+        data = orjson.loads(self.saved(2).read_bytes())
+        self.assertEqual([e["id"] for e in data["results"]], [2])
@@ -0,0 +1,121 @@
+import unittest
+
+from kd.cli import get_album_stats, parse_media_items
+
+
+class ParseMediaItemsTests(unittest.TestCase):
+    def test_builds_date_folders_and_filenames(self):
+        items = parse_media_items(
+            {
+                "results": [
+                    {
+                        "created": "2026-03-27T10:00:00",
+                        "attached_images": [
+                            {"original": "https://example.com/a.jpg"},
+                            {"original": "https://example.com/b.jpg"},
+                        ],
+                        "attached_video": {"high": "https://example.com/v.mp4"},
+                    },
+                    {
+                        "created": "2026-03-26T09:00:00Z",
+                        "attached_images": [{"original": "https://example.com/c.jpg"}],
+                    },
+                    {
+                        "created": "20260325T080000",
+                        "attached_images": [{"original": "https://example.com/d.jpg"}],
+                    },
+                ]
+            }
+        )
+
+        self.assertEqual(
+            [(item.folder, item.filename, item.url) for item in items],
+            [
+                ("2026/03/27", "2026-03-27-0.jpg", "https://example.com/a.jpg"),
+                ("2026/03/27", "2026-03-27-1.jpg", "https://example.com/b.jpg"),
+                ("2026/03/27", "2026-03-27.mp4", "https://example.com/v.mp4"),
+                ("2026/03/26", "2026-03-26-0.jpg", "https://example.com/c.jpg"),
+                ("2026/03/25", "2026-03-25-0.jpg", "https://example.com/d.jpg"),
+            ],
+        )
+
+    def test_skips_entries_without_valid_created(self):
+        items = parse_media_items(
+            {
+                "results": [
+                    {"attached_images": [{"original": "https://example.com/a.jpg"}]},
+                    {
+                        "created": "not-a-date",
+                        "attached_images": [{"original": "https://example.com/b.jpg"}],
+                    },
+                    {
+                        "created": "2026-03-27T10:00:00",
+                        "attached_images": [{"original": ""}],
+                        "attached_video": {"high": ""},
+                    },
+                ]
+            }
+        )
+
+        self.assertEqual(items, [])
+
+    def test_renames_files_of_later_album_on_same_date(self):
+        # list.json은 최신 앨범이 앞에 옵니다.
+        items = parse_media_items(
+            {
+                "results": [
+                    {
+                        "id": 20,
+                        "created": "2026-03-27T15:00:00",
+                        "attached_images": [{"original": "https://example.com/c.jpg"}],
+                        "attached_video": {"high": "https://example.com/w.mp4"},
+                    },
+                    {
+                        "id": 10,
+                        "created": "2026-03-27T09:00:00",
+                        "attached_images": [
+                            {"original": "https://example.com/a.jpg"},
+                            {"original": "https://example.com/b.jpg"},
+                        ],
+                        "attached_video": {"high": "https://example.com/v.mp4"},
+                    },
+                ]
+            }
+        )
+
+        self.assertEqual(
+            [(item.relpath, item.url) for item in items],
+            [
+                ("2026/03/27/2026-03-27-0-20.jpg", "https://example.com/c.jpg"),
+                ("2026/03/27/2026-03-27-20.mp4", "https://example.com/w.mp4"),
+                ("2026/03/27/2026-03-27-0.jpg", "https://example.com/a.jpg"),
+                ("2026/03/27/2026-03-27-1.jpg", "https://example.com/b.jpg"),
+                ("2026/03/27/2026-03-27.mp4", "https://example.com/v.mp4"),
+            ],
+        )
+
+
+class AlbumStatsTests(unittest.TestCase):
+    def test_counts_media_and_date_range(self):
+        stats = get_album_stats(
+            {
+                "results": [
+                    {
+                        "created": "2026-03-27T10:00:00Z",
+                        "attached_images": [{"original": "a"}, {"original": "b"}],
+                        "attached_video": {"high": "v"},
+                    },
+                    {"created": "2026-01-05T09:00:00", "attached_images": []},
+                    {"created": "not-a-date", "attached_images": [{"original": "c"}]},
+                ]
+            }
+        )
+
+        self.assertEqual(stats, "앨범 3개, 미디어 4개 (2026-01-05 ~ 2026-03-27)")
+
+    def test_empty_results(self):
+        self.assertEqual(get_album_stats({"results": []}), "0개")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,63 @@
+import unittest
+
+from aiohttp import web
+from aiohttp.test_utils import TestServer
+from yarl import URL
+
+from kd.cli import build_cookie_jar, create_session
+
+COOKIES = [
+    {
+        "name": "sessionid",
+        "value": "abc:def=1",
+        "domain": ".kidsnote.com",
+        "path": "/",
+        "secure": True,
+    },
+    {"name": "csrftoken", "value": "xyz", "domain": "www.kidsnote.com"},
+]
+
+
+class CookieJarTests(unittest.IsolatedAsyncioTestCase):
+    async def test_sends_saved_cookies_only_to_their_domain(self):
+        jar = build_cookie_jar(COOKIES)
+
+        kidsnote = jar.filter_cookies(URL("https://www.kidsnote.com/api/v1_3/"))
+        other = jar.filter_cookies(URL("https://example.com/"))
+
+        self.assertEqual(kidsnote["sessionid"].value, "abc:def=1")
+        self.assertEqual(kidsnote["csrftoken"].value, "xyz")
+        self.assertEqual(len(other), 0)
+
+
+class SessionCookieTests(unittest.IsolatedAsyncioTestCase):
+    async def asyncSetUp(self):
+        self.received: list[str | None] = []
+
+        async def handler(request):
+            self.received.append(request.headers.get("Cookie"))
+            return web.Response(body=b"ok")
+
+        app = web.Application()
+        app.router.add_get("/media.jpg", handler)
+        self.server = TestServer(app)
+        await self.server.start_server()
+        self.addAsyncCleanup(self.server.close)
+
+    async def fetch(self, **kwargs) -> str | None:
+        async with create_session(cookies=COOKIES, **kwargs) as session:
+            async with session.get(self.server.make_url("/media.jpg")) as resp:
+                await resp.read()
+        return self.received[-1]
+
+    async def test_api_session_keeps_cookies_on_kidsnote_domain(self):
+        self.assertIsNone(await self.fetch())
+
+    async def test_download_session_sends_cookies_to_media_hosts(self):
+        self.assertEqual(
+            await self.fetch(all_hosts=True), "sessionid=abc:def=1; csrftoken=xyz"
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()
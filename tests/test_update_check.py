@@ -0,0 +1,83 @@
+import tempfile
+import unittest
+import urllib.error
+from datetime import datetime, timedelta
+from pathlib import Path
+from unittest import mock
+
+import orjson
+
+from kd import cli
+
+
+class UpdateCacheTestCase(unittest.TestCase):
+    def setUp(self):
+        tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp.cleanup)
+        self.cache_file = Path(tmp.name) / "update_check.json"
+        patcher = mock.patch.object(cli, "UPDATE_CHECK_FILE", self.cache_file)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def write_cache(self, last_check: datetime, latest_version: str):
+        self.cache_file.write_bytes(
+            orjson.dumps(
+                {
+                    "last_check": last_check.isoformat(),
+                    "latest_version": latest_version,
+                }
+            )
+        )
+
+
+class CheckCachedTests(UpdateCacheTestCase):
+    def test_missing_or_stale_cache_needs_refresh(self):
+        self.assertIsNone(cli.check_cached())
+
+        self.write_cache(datetime.now() - timedelta(days=2), "99.0.0")
+        self.assertIsNone(cli.check_cached())
+
+    def test_fresh_cache_reports_newer_version(self):
+        self.write_cache(datetime.now(), "99.0.0")
+        self.assertEqual(cli.check_cached(), (True, "99.0.0"))
+
+        self.write_cache(datetime.now(), "0.0.1")
+        self.assertEqual(cli.check_cached(), (False, None))
+
+
+class CheckRemoteTests(UpdateCacheTestCase):
+    def test_not_modified_keeps_cached_version_and_refreshes_time(self):
+        self.write_cache(datetime.now() - timedelta(days=2), "99.0.0")
+        cache = orjson.loads(self.cache_file.read_bytes())
+        cache["etag"] = '"abc"'
+        self.cache_file.write_bytes(orjson.dumps(cache))
+
+        def not_modified(req, timeout):
+            self.assertEqual(req.get_header("If-none-match"), '"abc"')
+            raise urllib.error.HTTPError(req.full_url, 304, "Not Modified", {}, None)
+
+        with mock.patch("urllib.request.urlopen", not_modified):
+            self.assertEqual(cli.check_remote(), (True, "99.0.0"))
+
+        self.assertEqual(cli.check_cached(), (True, "99.0.0"))
+        self.assertEqual(orjson.loads(self.cache_file.read_bytes())["etag"], '"abc"')
+
+
+class UpdateNoticeTests(UpdateCacheTestCase):
+    def test_spawns_background_check_at_most_once_per_retry_interval(self):
+        self.write_cache(datetime.now() - timedelta(days=2), "99.0.0")
+
+        with mock.patch.object(cli, "_spawn_update_check") as spawn:
+            cli.show_update_notice()
+            cli.show_update_notice()
+            self.assertEqual(spawn.call_count, 1)
+
+            cache = orjson.loads(self.cache_file.read_bytes())
+            cache["last_attempt"] = (datetime.now() - timedelta(hours=2)).isoformat()
+            self.cache_file.write_bytes(orjson.dumps(cache))
+            cli.show_update_notice()
+            self.assertEqual(spawn.call_count, 2)
+
+
+if __name__ == "__main__":
+    unittest.main()